@@ -1,8 +1,15 @@
-"""WSGI entry point for the D&D World Generator backend."""
+"""WSGI entry point for the D&D World Generator backend.
+
+Serve ``app:app`` with a production WSGI server (see the README); running
+this module directly starts Werkzeug's development server instead.
+"""
+
+import os
 
 from dnd_world.backend import create_app
 
 app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # The debugger and reloader are opt-in via FLASK_DEBUG=1.
+    app.run(debug=os.environ.get('FLASK_DEBUG', '').lower() in {'1', 'true', 'yes', 'on'})
@@ -2,12 +2,21 @@
 from __future__ import annotations
 
 from flask import Flask
+import os
 import secrets
 
 from dnd_world.database import db, init_app as init_database
+from .json_provider import init_app as init_json
 from .routes import bp, ensure_default_character, populate_standard_enemies
 
 
+def init_db() -> None:
+    """Create missing tables and seed the enemy catalogue and default character."""
+    db.create_all()
+    populate_standard_enemies()
+    ensure_default_character()
+
+
 def create_app(config: dict | None = None) -> Flask:
     app = Flask(__name__)
     
@@ -15,19 +24,28 @@ def create_app(config: dict | None = None) -> Flask:
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['JSON_SORT_KEYS'] = False
     app.config['SECRET_KEY'] = secrets.token_hex(32)
+    # Set DND_AUTO_INIT_DB=0 when `flask init-db` runs once before deployment.
+    app.config['AUTO_INIT_DB'] = os.environ.get('DND_AUTO_INIT_DB', '1') != '0'
+    # Set DND_STRICT_LOADING=1 in development to make unplanned lazy loads raise.
+    app.config['STRICT_LOADING'] = os.environ.get('DND_STRICT_LOADING', '0') == '1'
 
     if config:
         app.config.update(config)
 
+    init_json(app)
     init_database(app)
     app.register_blueprint(bp)
 
-    with app.app_context():
-        db.create_all()
-        populate_standard_enemies()
-        ensure_default_character()
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create tables and seed reference data."""
+        init_db()
+
+    if app.config['AUTO_INIT_DB']:
+        with app.app_context():
+            init_db()
 
     return app
 
 
-__all__ = ["create_app"]
+__all__ = ["create_app", "init_db"]
@@ -0,0 +1,38 @@
+"""orjson-backed JSON provider for ``jsonify`` and ``request.get_json``."""
+from __future__ import annotations
+
+import typing as t
+
+from flask.json.provider import DefaultJSONProvider
+
+# None when orjson is not installed; serialization decides that for the whole package
+from dnd_world.utils.serialization import loads, orjson
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Drop-in replacement for Flask's default provider.
+
+    Key sorting, pretty-printing in debug mode and the ``default`` fallback
+    (dates, dataclasses, ``__html__``) behave as before; only the encoder and
+    decoder change.
+    """
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
+        return loads(s)
+
+
+def init_app(app) -> None:
+    """Install the orjson provider when orjson is available."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+
+__all__ = ["OrjsonProvider", "init_app"]
@@ -1,9 +1,12 @@
 """Character management endpoints."""
 from __future__ import annotations
 
+import copy
+import functools
 from typing import Any, Dict
 
-from flask import jsonify, request, session
+from flask import abort, current_app, jsonify, request, session
+from sqlalchemy.orm import raiseload, selectinload
 
 from dnd_world.database import db
 from dnd_world.models import Character, Item
@@ -13,6 +16,7 @@ from dnd_world.core.items import (
     EquipmentSlot,
 )
 from dnd_world.core.spells import get_cantrips_known, get_spells_known
+from dnd_world.utils.serialization import dumps
 
 from . import bp
 
@@ -40,14 +44,26 @@ def _to_bool(value):
     return bool(value)
 
 
+_ABILITY_SCORES = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+
+_HIT_DICE = {
+    'barbarian': 12,
+    'fighter': 10, 'paladin': 10, 'ranger': 10,
+    'bard': 8, 'cleric': 8, 'druid': 8, 'monk': 8, 'rogue': 8, 'warlock': 8,
+    'sorcerer': 6, 'wizard': 6
+}
+
+_EMPTY_EQUIPMENT_SLOTS = dict.fromkeys(slot.value for slot in EquipmentSlot)
+
+
 def calculate_max_hp(char_class: str, constitution_mod: int, level: int = 1) -> int:
-    class_hit_dice = {
-        'barbarian': 12,
-        'fighter': 10, 'paladin': 10, 'ranger': 10,
-        'bard': 8, 'cleric': 8, 'druid': 8, 'monk': 8, 'rogue': 8, 'warlock': 8,
-        'sorcerer': 6, 'wizard': 6
-    }
-    base_hp = class_hit_dice.get((char_class or '').lower(), 8)
+    return _average_max_hp((char_class or '').lower(), constitution_mod, level)
+
+
+@functools.lru_cache(maxsize=256)
+def _average_max_hp(char_class: str, constitution_mod: int, level: int) -> int:
+    """Cached on the lowercased class so 'Fighter' and 'fighter' share an entry."""
+    base_hp = _HIT_DICE.get(char_class, 8)
     max_hp = base_hp + constitution_mod
     if level > 1:
         avg_hp_per_level = ((base_hp + 1) // 2) + constitution_mod
@@ -55,6 +71,13 @@ def calculate_max_hp(char_class: str, constitution_mod: int, level: int = 1) ->
     return max_hp
 
 
+def _loader_options(*options):
+    """Query options, plus ``raiseload('*')`` when STRICT_LOADING is enabled."""
+    if current_app.config.get('STRICT_LOADING'):
+        return (*options, raiseload('*'))
+    return options
+
+
 def _payload() -> Dict[str, Any]:
     data = request.get_json(silent=True)
     if data is None or not isinstance(data, dict):
@@ -85,78 +108,87 @@ def _serialize_item(item: Item) -> Dict[str, Any]:
     }
 
 
+# The character fields exposed by the API; /api/characters selects only these columns.
+_SERIALIZED_CHARACTER_COLUMNS = (
+    Character.id, Character.name, Character.gender, Character.race, Character.character_class,
+    Character.level, Character.experience, Character.current_hp, Character.max_hp, Character.armor_class,
+    Character.strength, Character.dexterity, Character.constitution,
+    Character.intelligence, Character.wisdom, Character.charisma,
+    Character.gold, Character.silver, Character.copper, Character.platinum,
+)
+
+
 def _serialize_character(character: Character) -> Dict[str, Any]:
+    return {column.key: getattr(character, column.key) for column in _SERIALIZED_CHARACTER_COLUMNS}
+
+
+def _template_columns(template) -> Dict[str, Any]:
+    """Map a core item template onto ``Item`` column values."""
+    effects = [{'type': e['type'], 'value': e['value'], 'description': e['description']} for e in template.effects]
     return {
-        'id': character.id,
-        'name': character.name,
-        'gender': character.gender,
-        'race': character.race,
-        'character_class': character.character_class,
-        'level': character.level,
-        'experience': character.experience,
-        'current_hp': character.current_hp,
-        'max_hp': character.max_hp,
-        'armor_class': character.armor_class,
-        'strength': character.strength,
-        'dexterity': character.dexterity,
-        'constitution': character.constitution,
-        'intelligence': character.intelligence,
-        'wisdom': character.wisdom,
-        'charisma': character.charisma,
-        'gold': character.gold,
-        'silver': character.silver,
-        'copper': character.copper,
-        'platinum': character.platinum,
+        'name': template.name,
+        'item_type': getattr(template.item_type, 'value', str(template.item_type)),
+        'description': template.description,
+        'weight': template.weight,
+        'value': template.value,
+        'rarity': getattr(template.rarity, 'value', str(template.rarity)),
+        'magical': template.magical,
+        'requires_attunement': template.requires_attunement,
+        'tags': list(template.tags) if template.tags else None,
+        'effects': effects or None,
+        'damage': getattr(template, 'damage', None),
+        'damage_type': getattr(template, 'damage_type', None),
+        'weapon_properties': list(getattr(template, 'properties', [])) or None,
+        'enchantment_bonus': getattr(template, 'enchantment_bonus', 0),
+        'base_ac': getattr(template, 'base_ac', None),
+        'armor_type': getattr(template, 'armor_type', None),
+        'strength_req': getattr(template, 'strength_req', 0),
+        'stealth_disadvantage': getattr(template, 'stealth_disadvantage', False),
+        'uses': getattr(template, 'uses', None),
+        'max_uses': getattr(template, 'max_uses', None),
+        'charges': getattr(template, 'charges', None),
+        'max_charges': getattr(template, 'max_charges', None),
     }
 
 
+# Predefined item templates are static, so their column values are built once at import.
+_ITEM_TEMPLATE_COLUMNS = {name: _template_columns(template) for name, template in ALL_ITEMS.items()}
+
+# Starting kits are static, so their insert rows are built once at import.
+_STARTING_EQUIPMENT_ROWS = {
+    char_class: [
+        _template_columns(template)
+        for item_list in equipment.values()
+        for template in item_list
+    ]
+    for char_class, equipment in CLASS_EQUIPMENT.items()
+}
+
+
 def add_starting_equipment(character: Character) -> None:
-    equipment = CLASS_EQUIPMENT.get((character.character_class or '').lower())
-    if not equipment:
+    """Insert the class starting kit in a single statement; the caller commits."""
+    kit = _STARTING_EQUIPMENT_ROWS.get((character.character_class or '').lower())
+    if not kit:
         return
-    for item_list in equipment.values():
-        for template in item_list:
-            character.add_item(
-                name=template.name,
-                item_type=getattr(template.item_type, 'value', str(template.item_type)),
-                description=template.description,
-                weight=template.weight,
-                value=template.value,
-                rarity=getattr(template.rarity, 'value', str(template.rarity)),
-                magical=template.magical,
-                requires_attunement=template.requires_attunement,
-                tags=template.tags,
-                effects=[{'type': e['type'], 'value': e['value'], 'description': e['description']} for e in template.effects],
-                damage=getattr(template, 'damage', None),
-                damage_type=getattr(template, 'damage_type', None),
-                weapon_properties=getattr(template, 'properties', []),
-                enchantment_bonus=getattr(template, 'enchantment_bonus', 0),
-                base_ac=getattr(template, 'base_ac', None),
-                armor_type=getattr(template, 'armor_type', None),
-                strength_req=getattr(template, 'strength_req', 0),
-                stealth_disadvantage=getattr(template, 'stealth_disadvantage', False),
-                uses=getattr(template, 'uses', None),
-                max_uses=getattr(template, 'max_uses', None),
-                charges=getattr(template, 'charges', None),
-                max_charges=getattr(template, 'max_charges', None),
-            )
+    rows = [{**row, 'character_id': character.id} for row in kit]
+    db.session.execute(Item.__table__.insert(), rows)
 
 
 @bp.route('/create_character', methods=['POST'])
 def create_character():
     data = _payload()
-    required = ['name', 'gender', 'race', 'class', 'strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma']
+    required = ['name', 'gender', 'race', 'class', *_ABILITY_SCORES]
     missing = [field for field in required if field not in data]
     if missing:
         return jsonify({'error': f"Missing fields: {', '.join(missing)}"}), 400
 
     try:
-        constitution = _to_int(data.get('constitution'))
-        constitution_mod = (constitution - 10) // 2
+        abilities = {ability: _to_int(data[ability]) for ability in _ABILITY_SCORES}
+        constitution_mod = (abilities['constitution'] - 10) // 2
+        dexterity_mod = (abilities['dexterity'] - 10) // 2
         char_class = data['class']
         level = _to_int(data.get('level'), 1)
         max_hp = calculate_max_hp(char_class, constitution_mod, level)
-        dexterity = _to_int(data.get('dexterity'))
         
         # Get current user ID from session or request data
         user_id = session.get('user_id') or data.get('user_id')
@@ -173,24 +205,20 @@ def create_character():
             experience=_to_int(data.get('experience')),
             max_hp=max_hp,
             current_hp=max_hp,
-            armor_class=10 + ((dexterity - 10) // 2),
-            strength=_to_int(data.get('strength')),
-            dexterity=dexterity,
-            constitution=constitution,
-            intelligence=_to_int(data.get('intelligence')),
-            wisdom=_to_int(data.get('wisdom')),
-            charisma=_to_int(data.get('charisma')),
+            armor_class=10 + dexterity_mod,
             gold=_to_int(data.get('gold'), 50),
             silver=_to_int(data.get('silver')),
             copper=_to_int(data.get('copper')),
             platinum=_to_int(data.get('platinum')),
             user_id=user_id,  # Associate character with current user
+            **abilities,
         )
     except ValueError:
         return jsonify({'error': 'Ability scores must be integers.'}), 400
 
+    # Character, spells and starting kit share one transaction; flush for the id.
     db.session.add(new_character)
-    db.session.commit()
+    db.session.flush()
 
     if new_character.is_spellcaster():
         new_character.refresh_spell_slots()
@@ -205,7 +233,6 @@ def create_character():
             starting_spells.extend(available_first[:spells_known])
         new_character.set_known_spells_list(starting_spells)
         new_character.set_prepared_spells_list(starting_spells)
-        db.session.commit()
 
     add_starting_equipment(new_character)
     db.session.commit()
@@ -215,9 +242,11 @@ def create_character():
 
 @bp.route('/delete_character/<int:character_id>', methods=['POST'])
 def delete_character(character_id: int):
-    character = Character.query.get_or_404(character_id)
-    db.session.delete(character)
+    # Items and combatants are removed by the ON DELETE CASCADE foreign keys.
+    result = db.session.execute(db.delete(Character).where(Character.id == character_id))
     db.session.commit()
+    if not result.rowcount:
+        abort(404)
     return jsonify({'success': True})
 
 
@@ -229,22 +258,26 @@ def api_characters():
     
     if user_id:
         # Return only characters belonging to the logged-in user
-        characters = Character.query.filter_by(user_id=user_id).all()
+        # Plain column rows: the listing never touches Character instances
+        rows = db.session.execute(
+            db.select(*_SERIALIZED_CHARACTER_COLUMNS).where(Character.user_id == user_id)
+        ).mappings()
+        characters = [dict(row) for row in rows]
     else:
         # If not logged in, return empty list (no access to any characters)
         characters = []
     
-    return jsonify([_serialize_character(char) for char in characters])
+    body = dumps(characters)
+    return current_app.response_class(body, mimetype='application/json')
 
 
 @bp.route('/character/<int:character_id>/inventory')
 def character_inventory(character_id: int):
-    character = Character.query.get_or_404(character_id)
-    equipped_items = Item.query.filter_by(character_id=character_id).filter(Item.equipped_slot.isnot(None)).all()
-    carried_items = Item.query.filter_by(character_id=character_id).filter(Item.equipped_slot.is_(None)).all()
-    equipment_slots = {slot.value: None for slot in EquipmentSlot}
-    for item in equipped_items:
-        equipment_slots[item.equipped_slot] = item.id
+    character = Character.query.options(*_loader_options(selectinload(Character.inventory))).get_or_404(character_id)
+    equipped_items = [item for item in character.inventory if item.equipped_slot is not None]
+    carried_items = [item for item in character.inventory if item.equipped_slot is None]
+    equipment_slots = dict(_EMPTY_EQUIPMENT_SLOTS)
+    equipment_slots.update((item.equipped_slot, item.id) for item in equipped_items)
     return jsonify({
         'character_id': character.id,
         'equipped_items': [_serialize_item(item) for item in equipped_items],
@@ -261,6 +294,8 @@ def equip_item(character_id: int, item_id: int):
     if not slot:
         return jsonify({'success': False, 'message': 'slot is required'}), 400
     success, message = character.equip_item(item_id, slot)
+    if success:
+        db.session.commit()
     status = 200 if success else 400
     return jsonify({'success': success, 'message': message}), status
 
@@ -273,6 +308,8 @@ def unequip_item(character_id: int):
     if not slot:
         return jsonify({'success': False, 'message': 'slot is required'}), 400
     success, message = character.unequip_item(slot)
+    if success:
+        db.session.commit()
     status = 200 if success else 400
     return jsonify({'success': success, 'message': message}), status
 
@@ -289,19 +326,9 @@ def add_item_to_character(character_id: int):
         return jsonify({'success': False, 'message': 'item_name is required'}), 400
 
     if item_name in ALL_ITEMS:
-        template = ALL_ITEMS[item_name]
-        character.add_item(
-            name=template.name,
-            item_type=getattr(template.item_type, 'value', str(template.item_type)),
-            description=template.description,
-            weight=template.weight,
-            value=template.value,
-            rarity=getattr(template.rarity, 'value', str(template.rarity)),
-            magical=template.magical,
-            requires_attunement=template.requires_attunement,
-            tags=template.tags,
-            effects=[{'type': e['type'], 'value': e['value'], 'description': e['description']} for e in template.effects],
-        )
+        # Deep copy so the row's tags/effects/weapon_properties lists never alias the shared template
+        columns = copy.deepcopy(_ITEM_TEMPLATE_COLUMNS[item_name])
+        db.session.add(Item(**columns, character_id=character.id))
     else:
         character.add_item(
             name=item_name,
@@ -403,6 +430,6 @@ def ensure_default_character() -> None:
         **abilities,
     )
     db.session.add(default_character)
-    db.session.commit()
+    db.session.flush()
     add_starting_equipment(default_character)
     db.session.commit()
@@ -1,15 +1,16 @@
 """Combat endpoints and helpers."""
 from __future__ import annotations
 
-import json
 from typing import Dict
 
-from flask import jsonify, request
+from flask import abort, jsonify, request
+from sqlalchemy.orm import selectinload
 
 from dnd_world.database import db
 from dnd_world.models import Character, Combat, Combatant, CombatAction, Enemy
 from dnd_world.core.enemies import STANDARD_ENEMIES, get_enemy_by_name, get_random_enemy_for_level
 from dnd_world.core.combat_engine import CombatEngine
+from dnd_world.utils.serialization import dumps
 
 from . import bp
 
@@ -18,13 +19,16 @@ GRID_COLS = 20
 GRID_ROWS = 15
 spatial_states: Dict[int, Dict[str, object]] = {}
 
+# Loads a combat's combatants and their characters alongside it
+_ROSTER = selectinload(Combat.combatants).joinedload(Combatant.character)
+
 
 def _manhattan(a, b):
     return abs(a['x'] - b['x']) + abs(a['y'] - b['y'])
 
 
 def _init_spatial_positions(combat_id: int):
-    combat = Combat.query.get(combat_id)
+    combat = Combat.query.options(_ROSTER).get(combat_id)
     if not combat:
         return
     positions = {}
@@ -32,7 +36,7 @@ def _init_spatial_positions(combat_id: int):
     right_col = GRID_COLS - 2
     y_left = 1
     y_right = 1
-    for combatant in sorted(combat.combatants, key=lambda x: x.initiative, reverse=True):
+    for combatant in combat.turn_order:
         is_monster = (combatant.character.character_class or '').lower() == 'monster'
         if is_monster:
             positions[combatant.id] = {'x': right_col, 'y': y_right}
@@ -95,13 +99,13 @@ def populate_standard_enemies():
             experience_points=enemy_data.experience_points,
             passive_perception=enemy_data.passive_perception,
             darkvision=enemy_data.darkvision,
-            saving_throws=json.dumps(enemy_data.saving_throws),
-            skills=json.dumps(enemy_data.skills),
-            damage_resistances=json.dumps(enemy_data.damage_resistances),
-            damage_immunities=json.dumps(enemy_data.damage_immunities),
-            condition_immunities=json.dumps(enemy_data.condition_immunities),
-            languages=json.dumps(enemy_data.languages),
-            actions=json.dumps([
+            saving_throws=dumps(enemy_data.saving_throws),
+            skills=dumps(enemy_data.skills),
+            damage_resistances=dumps(enemy_data.damage_resistances),
+            damage_immunities=dumps(enemy_data.damage_immunities),
+            condition_immunities=dumps(enemy_data.condition_immunities),
+            languages=dumps(enemy_data.languages),
+            actions=dumps([
                 {
                     'name': action.name,
                     'description': action.description,
@@ -113,7 +117,7 @@ def populate_standard_enemies():
                 }
                 for action in enemy_data.actions
             ]),
-            special_abilities=json.dumps(enemy_data.special_abilities),
+            special_abilities=dumps(enemy_data.special_abilities),
         )
         db.session.add(enemy)
     db.session.commit()
@@ -126,42 +130,60 @@ def start_combat():
     character_ids = data.get('character_ids', [])
     if not character_ids:
         return jsonify({'error': 'No characters provided'}), 400
+    # JSON clients may send ids as strings; the roster lookup below is keyed by int
+    try:
+        character_ids = [int(char_id) for char_id in character_ids]
+    except (TypeError, ValueError):
+        return jsonify({'error': 'character_ids must be integers'}), 400
 
     combat = Combat(name=combat_name)
     db.session.add(combat)
     db.session.flush()
 
+    characters = {
+        character.id: character
+        for character in Character.query.filter(Character.id.in_(character_ids))
+    }
+    rows = []
     for char_id in character_ids:
-        character = Character.query.get(char_id)
+        character = characters.get(char_id)
         if not character:
             continue
-        initiative = CombatEngine.roll_initiative(character.dexterity_modifier)
-        combatant = Combatant(
-            combat_id=combat.id,
-            character_id=char_id,
-            initiative=initiative,
-            current_hp=character.current_hp,
-        )
-        db.session.add(combatant)
+        rows.append({
+            'combat_id': combat.id,
+            'character_id': char_id,
+            'initiative': CombatEngine.roll_initiative(character.dexterity_modifier),
+            'current_hp': character.current_hp,
+        })
+    if rows:
+        # One executemany; the roster is reloaded below, so no ORM objects are needed here
+        db.session.execute(Combatant.__table__.insert(), rows)
     db.session.commit()
 
+    # Loads the roster in two queries; the status payload below reuses it
     _init_spatial_positions(combat.id)
 
     return jsonify(combat_status_payload(combat))
 
 
+def _combat_with_roster(combat_id: int) -> Combat:
+    """Load a combat with its combatants and their characters in two queries."""
+    return Combat.query.options(_ROSTER).get_or_404(combat_id)
+
+
 def combat_status_payload(combat: Combat) -> dict:
     combatants = []
     for combatant in combat.combatants:
+        character = combatant.character
         combatants.append({
             'id': combatant.id,
-            'character_name': combatant.character.name,
-            'character_class': combatant.character.character_class,
+            'character_name': character.name,
+            'character_class': character.character_class,
             'initiative': combatant.initiative,
             'current_hp': combatant.current_hp,
-            'max_hp': combatant.character.max_hp,
+            'max_hp': character.max_hp,
             'temp_hp': combatant.temp_hp,
-            'ac': combatant.character.armor_class,
+            'ac': character.armor_class,
             'conditions': combatant.conditions_list,
             'is_conscious': combatant.is_conscious,
             'is_dead': combatant.is_dead,
@@ -188,19 +210,21 @@ def combat_status_payload(combat: Combat) -> dict:
 
 @bp.route('/combat/<int:combat_id>/status')
 def combat_status(combat_id: int):
-    combat = Combat.query.get_or_404(combat_id)
+    combat = _combat_with_roster(combat_id)
     return jsonify(combat_status_payload(combat))
 
 
 @bp.route('/combat/<int:combat_id>/end_turn', methods=['POST'])
 def end_turn(combat_id: int):
-    combat = Combat.query.get_or_404(combat_id)
+    combat = _combat_with_roster(combat_id)
     current = combat.current_combatant
     if current:
         current.reset_turn_actions()
     combat.next_turn()
+    # Build the payload before committing so the roster is not reloaded after expiry
+    payload = combat_status_payload(combat)
     db.session.commit()
-    return jsonify(combat_status_payload(combat))
+    return jsonify(payload)
 
 
 @bp.route('/combat/<int:combat_id>/add_enemy', methods=['POST'])
@@ -212,7 +236,13 @@ def add_enemy_to_combat(combat_id: int):
     if enemy_name:
         enemy_template = get_enemy_by_name(enemy_name)
     else:
-        party_level = sum(c.character.level for c in combat.combatants) // max(len(combat.combatants), 1)
+        level_total, party_size = (
+            db.session.query(db.func.coalesce(db.func.sum(Character.level), 0), db.func.count(Combatant.id))
+            .join(Combatant.character)
+            .filter(Combatant.combat_id == combat.id)
+            .one()
+        )
+        party_level = level_total // max(party_size, 1)
         enemy_template = get_random_enemy_for_level(party_level)
 
     if not enemy_template:
@@ -255,7 +285,7 @@ def add_enemy_to_combat(combat_id: int):
 
 @bp.route('/api/spatial/<int:combat_id>/state')
 def spatial_state(combat_id: int):
-    combat = Combat.query.get_or_404(combat_id)
+    combat = _combat_with_roster(combat_id)
     state = _get_spatial_state(combat_id)
     if not state:
         return jsonify({'error': 'Spatial state unavailable'}), 500
@@ -263,12 +293,13 @@ def spatial_state(combat_id: int):
     roster = []
     for combatant in combat.combatants:
         pos = positions.get(combatant.id, {'x': 0, 'y': 0})
+        character = combatant.character
         roster.append({
             'id': combatant.id,
-            'name': combatant.character.name,
+            'name': character.name,
             'hp': combatant.current_hp,
-            'max_hp': combatant.character.max_hp,
-            'ac': combatant.character.armor_class,
+            'max_hp': character.max_hp,
+            'ac': character.armor_class,
             'is_conscious': combatant.is_conscious,
             'is_dead': combatant.is_dead,
             'x': pos['x'],
@@ -293,8 +324,10 @@ def spatial_move(combat_id: int):
     if combatant_id is None or x is None or y is None:
         return jsonify({'error': 'combatant_id, x and y are required'}), 400
 
-    combatant = Combatant.query.get_or_404(int(combatant_id))
-    combat = Combat.query.get_or_404(combat_id)
+    combat = Combat.query.options(selectinload(Combat.combatants)).get_or_404(combat_id)
+    combatant = next((c for c in combat.combatants if c.id == int(combatant_id)), None)
+    if combatant is None:
+        abort(404)
 
     if combat.current_combatant is None or combat.current_combatant.id != combatant.id:
         return jsonify({'error': 'Not your turn'}), 400
@@ -331,9 +364,12 @@ def spatial_attack(combat_id: int):
     if not attacker_id or not target_id:
         return jsonify({'error': 'attacker_id and target_id are required'}), 400
 
-    combat = Combat.query.get_or_404(combat_id)
-    attacker = Combatant.query.get_or_404(attacker_id)
-    target = Combatant.query.get_or_404(target_id)
+    combat = _combat_with_roster(combat_id)
+    roster = {combatant.id: combatant for combatant in combat.combatants}
+    attacker = roster.get(attacker_id)
+    target = roster.get(target_id)
+    if attacker is None or target is None:
+        abort(404)
 
     if combat.current_combatant is None or combat.current_combatant.id != attacker_id:
         return jsonify({'error': "Not attacker's turn"}), 400
@@ -352,7 +388,7 @@ def spatial_attack(combat_id: int):
         return jsonify({'error': 'Target out of melee range'}), 400
 
     attack_bonus = CombatEngine.calculate_weapon_attack_bonus(attacker.character, None)
-    target_ac = CombatEngine.calculate_ac(target.character)
+    target_ac = target.character.armor_class
     hit, attack_roll, critical = CombatEngine.make_attack_roll(attack_bonus, target_ac)
 
     damage_dealt = 0
@@ -366,18 +402,17 @@ def spatial_attack(combat_id: int):
         damage_type = dmg.damage_type
 
     attacker.has_action = False
-    db.session.commit()
 
-    action = CombatAction(
+    # The action log is append-only and never read back here, so skip the ORM unit of work
+    db.session.execute(CombatAction.__table__.insert().values(
         combat_id=combat_id,
         actor_id=attacker_id,
         target_id=target_id,
         action_type='attack',
         round_number=combat.current_round,
-        action_data=json.dumps({'spatial': True, 'attack_roll': attack_roll, 'critical': critical}),
-        result=json.dumps({'hit': hit, 'damage': damage_dealt, 'damage_type': damage_type}),
-    )
-    db.session.add(action)
+        action_data=dumps({'spatial': True, 'attack_roll': attack_roll, 'critical': critical}),
+        result=dumps({'hit': hit, 'damage': damage_dealt, 'damage_type': damage_type}),
+    ))
     db.session.commit()
 
     return jsonify({'success': True, 'hit': hit, 'attack_roll': attack_roll, 'critical': critical, 'damage': damage_dealt, 'damage_type': damage_type})
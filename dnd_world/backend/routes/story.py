@@ -1,13 +1,26 @@
 """Story generation endpoints."""
 
-from flask import jsonify, request
+from flask import current_app, jsonify, request
+from sqlalchemy.orm import load_only
 
+from dnd_world.database import db
 from dnd_world.models import Character
 from dnd_world.core.story import story_generator
+from dnd_world.utils.serialization import dumps
 
 from . import bp
 
 
+_STORY_SUGGESTIONS = (
+    "The party arrives at a mysterious village just before sunset.",
+    "A wounded messenger collapses at the heroes' feet, clutching a sealed letter.",
+    "Strange lights flicker in the depths of the ancient forest.",
+    "A noble requests the party's aid to investigate a haunted estate.",
+)
+
+_STORY_SUGGESTIONS_BODY = dumps({'suggestions': list(_STORY_SUGGESTIONS)})
+
+
 @bp.route('/generate_story', methods=['POST'])
 def generate_story():
     payload = request.get_json(silent=True) or request.form.to_dict()
@@ -22,7 +35,11 @@ def generate_story():
 
     character_context = ''
     if character_id:
-        character = Character.query.get(character_id)
+        character = (
+            Character.query
+            .options(load_only(Character.name, Character.character_class, Character.level))
+            .get(character_id)
+        )
         if character:
             character_context = (
                 f"Character: {character.name}, Class: {character.character_class}, "
@@ -30,6 +47,9 @@ def generate_story():
             )
             if not character_level:
                 character_level = character.level
+        # Hand the connection back to the pool before the (potentially slow)
+        # generation call instead of holding it until request teardown.
+        db.session.close()
 
     story = story_generator.generate_story(
         prompt=prompt,
@@ -43,10 +63,4 @@ def generate_story():
 
 @bp.route('/story_prompt_suggestions')
 def story_prompt_suggestions():
-    suggestions = [
-        "The party arrives at a mysterious village just before sunset.",
-        "A wounded messenger collapses at the heroes' feet, clutching a sealed letter.",
-        "Strange lights flicker in the depths of the ancient forest.",
-        "A noble requests the party's aid to investigate a haunted estate.",
-    ]
-    return jsonify({'suggestions': suggestions})
+    return current_app.response_class(_STORY_SUGGESTIONS_BODY, mimetype='application/json')
@@ -1,49 +1,110 @@
 """System-level endpoints: health checks, name generation, dice utilities."""
 
-from flask import jsonify, request
-from pynames import GENDER
-from pynames.generators.elven import WarhammerNamesGenerator, DnDNamesGenerator
-from pynames.generators.goblin import GoblinGenerator
-from pynames.generators.korean import KoreanNamesGenerator
-from pynames.generators.orc import OrcNamesGenerator
-from pynames.generators.russian import PaganNamesGenerator
-from pynames.generators.scandinavian import ScandinavianNamesGenerator
+import collections
+import functools
+
+from flask import current_app, jsonify, request
 
 from dnd_world.utils.dice import DiceRoller, apply_racial_bonuses, calculate_ability_modifier
+from dnd_world.utils.serialization import dumps
 
 from . import bp
 
 
-RACE_TO_GENERATOR = {
-    'dwarf': KoreanNamesGenerator(),
-    'elf': DnDNamesGenerator(),
-    'half-orc': OrcNamesGenerator(),
-    'gnome': GoblinGenerator(),
-    'human': ScandinavianNamesGenerator(),
-    'halfling': KoreanNamesGenerator(),
-    'dragonborn': KoreanNamesGenerator(),
-    'half-elf': WarhammerNamesGenerator(),
-    'tiefling': PaganNamesGenerator(),
-}
+@functools.lru_cache(maxsize=1)
+def _race_map():
+    """Import the pynames generator classes on the first name request."""
+    from pynames.generators.elven import WarhammerNamesGenerator, DnDNamesGenerator
+    from pynames.generators.goblin import GoblinGenerator
+    from pynames.generators.korean import KoreanNamesGenerator
+    from pynames.generators.orc import OrcNamesGenerator
+    from pynames.generators.russian import PaganNamesGenerator
+    from pynames.generators.scandinavian import ScandinavianNamesGenerator
+
+    return {
+        'dwarf': KoreanNamesGenerator,
+        'elf': DnDNamesGenerator,
+        'half-orc': OrcNamesGenerator,
+        'gnome': GoblinGenerator,
+        'human': ScandinavianNamesGenerator,
+        'halfling': KoreanNamesGenerator,
+        'dragonborn': KoreanNamesGenerator,
+        'half-elf': WarhammerNamesGenerator,
+        'tiefling': PaganNamesGenerator,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_generator(generator_cls):
+    """Construct each generator class at most once, on first use."""
+    return generator_cls()
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve(race, gender_str):
+    """Resolve request arguments to a generator and pynames gender.
+
+    Unknown races fall back to Scandinavian names.
+    """
+    from pynames import GENDER
+
+    generator_cls = _race_map().get(race.lower(), _race_map()['human'])
+    gender = GENDER.MALE if gender_str.lower() == 'male' else GENDER.FEMALE
+    return _get_generator(generator_cls), gender
+
+
+_HEALTH_BODY = dumps({'status': 'ok', 'service': 'dnd_world_api'})
+
+# id(generator) -> whether get_name_simple accepts a gender argument
+_SUPPORTS_GENDER = {}
+
+
+def _generate_name(generator, gender):
+    """Generate a name, probing gender support only once per generator."""
+    supports_gender = _SUPPORTS_GENDER.get(id(generator))
+    if supports_gender is None:
+        try:
+            name = generator.get_name_simple(gender)
+        except TypeError:
+            _SUPPORTS_GENDER[id(generator)] = False
+            return generator.get_name_simple()
+        _SUPPORTS_GENDER[id(generator)] = True
+        return name
+    if supports_gender:
+        return generator.get_name_simple(gender)
+    return generator.get_name_simple()
+
+
+_NAME_POOL_SIZE = 64
+
+# (id(generator), gender) -> names generated ahead of demand
+_NAME_POOLS = {}
+
+
+def _pooled_name(generator, gender):
+    """Serve a name from the generator's pool, refilling it in batches."""
+    pool = _NAME_POOLS.setdefault((id(generator), gender), collections.deque())
+    try:
+        return pool.popleft()
+    except IndexError:
+        names = [_generate_name(generator, gender) for _ in range(_NAME_POOL_SIZE)]
+        pool.extend(names[1:])
+        return names[0]
 
 
 @bp.route('/')
 def index():
     """Simple health check endpoint for the API."""
-    return jsonify({'status': 'ok', 'service': 'dnd_world_api'})
+    return current_app.response_class(_HEALTH_BODY, mimetype='application/json')
 
 
 @bp.route('/generate_name')
 def generate_name():
     race = request.args.get('race', 'human')
     gender_str = request.args.get('gender', 'male')
-    gender = GENDER.MALE if gender_str.lower() == 'male' else GENDER.FEMALE
-    generator = RACE_TO_GENERATOR.get(race.lower(), ScandinavianNamesGenerator())
-    try:
-        name = generator.get_name_simple(gender)
-    except TypeError:
-        name = generator.get_name_simple()
-    return jsonify({'name': name})
+    generator, gender = _resolve(race, gender_str)
+    name = _pooled_name(generator, gender)
+    return current_app.response_class(dumps({'name': name}), mimetype='application/json')
 
 
 @bp.route('/generate_ability_scores')
@@ -1,7 +1,6 @@
 # combat.py
 
 import random
-import json
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
@@ -34,7 +33,7 @@ class CombatEngine:
     @staticmethod
     def roll_dice(count: int, size: int, modifier: int = 0) -> int:
         """Roll dice and return the total."""
-        total = sum(random.randint(1, size) for _ in range(count))
+        total = sum(random.choices(range(1, size + 1), k=count))
         return total + modifier
     
     @staticmethod
@@ -101,6 +100,11 @@ class CombatEngine:
         hit = attack_roll >= target_ac
         return hit, attack_roll, critical
     
+    @staticmethod
+    def _weapon_properties_text(weapon) -> str:
+        """Lowercased weapon properties joined into one string for keyword checks."""
+        return " ".join(weapon.weapon_properties or ()).lower()
+    
     @staticmethod
     def calculate_weapon_attack_bonus(character, weapon) -> int:
         """Calculate attack bonus for a weapon."""
@@ -110,10 +114,10 @@ class CombatEngine:
         # Use STR for melee, DEX for ranged (simplified)
         if weapon and hasattr(weapon, 'weapon_properties'):
             # Check for finesse property (allows DEX for melee)
-            properties = weapon.weapon_properties or ""
-            if "finesse" in properties.lower():
+            properties = CombatEngine._weapon_properties_text(weapon)
+            if "finesse" in properties:
                 ability_mod = max(character.strength_modifier, character.dexterity_modifier)
-            elif "ranged" in properties.lower() or weapon.item_type == "ranged":
+            elif "ranged" in properties or weapon.item_type == "ranged":
                 ability_mod = character.dexterity_modifier
             else:
                 ability_mod = character.strength_modifier
@@ -137,7 +141,7 @@ class CombatEngine:
         
         # Add ability modifier
         if hasattr(weapon, 'weapon_properties') and weapon.weapon_properties:
-            properties = weapon.weapon_properties.lower()
+            properties = CombatEngine._weapon_properties_text(weapon)
             if "finesse" in properties:
                 ability_mod = max(character.strength_modifier, character.dexterity_modifier)
             elif "ranged" in properties:
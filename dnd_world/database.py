@@ -1,27 +1,71 @@
 """Database extensions and helpers."""
 
+import sqlite3
+
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from sqlalchemy import event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+
+from dnd_world.utils.serialization import dumps, loads
 
 
 db = SQLAlchemy()
 migrate = Migrate()
 
 
+def engine_options(database_uri):
+    """Engine settings for ``database_uri``.
+
+    JSON columns are encoded with the shared serialization helpers. In-memory
+    SQLite keeps Flask-SQLAlchemy's single shared connection; every other
+    database gets a bounded pool whose connections are checked before use and
+    recycled periodically.
+    """
+    options = {'json_serializer': dumps, 'json_deserializer': loads}
+    url = make_url(database_uri)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return options
+    options.update({
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_timeout': 30,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    })
+    if url.get_backend_name() == 'sqlite':
+        options['connect_args'] = {'check_same_thread': False}
+    return options
+
+
 def init_app(app):
     """Register database extensions with the Flask app."""
+    app.config.setdefault(
+        'SQLALCHEMY_ENGINE_OPTIONS',
+        engine_options(app.config['SQLALCHEMY_DATABASE_URI']),
+    )
     db.init_app(app)
     migrate.init_app(app, db)
 
 
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, _):
-    """Ensure SQLite enforces foreign keys."""
+    """Enforce foreign keys and tune SQLite for concurrent web traffic.
+
+    WAL lets readers proceed while a write is in progress, and with WAL
+    ``synchronous=NORMAL`` only syncs at checkpoints instead of on every commit.
+    Reads are served from a memory map and a 64 MiB page cache.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
     cursor.close()
 
 
-__all__ = ["db", "migrate", "init_app"]
+__all__ = ["db", "migrate", "engine_options", "init_app"]
@@ -1,9 +1,45 @@
 """SQLAlchemy model for player characters."""
 
+from functools import cached_property
+
+from sqlalchemy.ext.hybrid import hybrid_property
+
 from dnd_world.database import db
+from dnd_world.utils.serialization import dumps, loads
 from dnd_world.core.items import CharacterEquipment, EquipmentSlot
 from .item import Item
 
+
+def _modifier_expression(score):
+    """SQL form of ``(score - 10) // 2``.
+
+    SQLite integer division truncates towards zero, so halve the
+    (non-negative) score first to keep floor semantics for odd scores below 10.
+    """
+    return score // 2 - 5
+
+
+_SLOT_BY_NAME = {slot.value: slot for slot in EquipmentSlot}
+
+# Defaults for the optional Item columns accepted by Character.add_item
+_ITEM_DEFAULTS = {
+    'rarity': 'common',
+    'magical': False,
+    'requires_attunement': False,
+    'damage': None,
+    'damage_type': None,
+    'base_ac': None,
+    'armor_type': None,
+    'strength_req': 0,
+    'stealth_disadvantage': False,
+    'enchantment_bonus': 0,
+    'uses': None,
+    'max_uses': None,
+    'charges': None,
+    'max_charges': None,
+}
+
+
 # Character Model - Represents player characters with D&D 5e statistics and capabilities
 class Character(db.Model):
     """
@@ -15,7 +51,7 @@ class Character(db.Model):
     """
     # Basic information
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     gender = db.Column(db.String(20), nullable=False)
     race = db.Column(db.String(50), nullable=False)
     character_class = db.Column(db.String(50), nullable=False)
@@ -26,7 +62,7 @@ class Character(db.Model):
     armor_class = db.Column(db.Integer, nullable=False, default=10)
     
     # User relationship - each character belongs to a user
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)  # nullable for backward compatibility
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True, index=True)  # nullable for backward compatibility
     
     # Ability Scores - D&D 5e core stats
     strength = db.Column(db.Integer, nullable=False)
@@ -60,16 +96,17 @@ class Character(db.Model):
     # Relationships - Link to items owned by this character
     inventory = db.relationship(
         'Item',
-        backref=db.backref('owner'),
-        lazy=True,
-        cascade='all, delete-orphan'
+        back_populates='owner',
+        lazy='select',
+        cascade='all, delete-orphan',
+        passive_deletes=True
     )
 
     def __repr__(self):
         """String representation of the character."""
         return f'<Character {self.name}>'
     
-    @property
+    @cached_property
     def equipment(self):
         """
         Get character equipment manager.
@@ -80,20 +117,17 @@ class Character(db.Model):
         Returns:
             CharacterEquipment: An equipment manager for this character
         """
-        if not hasattr(self, '_equipment') or self._equipment is None:
-            self._equipment = CharacterEquipment()
-            # Load equipped items from database
-            equipped_items = Item.query.filter_by(character_id=self.id).filter(Item.equipped_slot.isnot(None)).all()
-            for item in equipped_items:
-                try:
-                    slot = EquipmentSlot(item.equipped_slot)
-                    self._equipment.slots[slot] = item
-                    if item.requires_attunement:
-                        self._equipment.attuned_items.append(item)
-                except ValueError:
-                    # Invalid slot, skip this item
-                    continue
-        return self._equipment
+        equipment = CharacterEquipment()
+        # Reuse the inventory relationship so an eager-loaded inventory costs no extra query
+        for item in self.inventory:
+            slot = _SLOT_BY_NAME.get(item.equipped_slot)
+            if slot is None:
+                # Not equipped, or an invalid slot
+                continue
+            equipment.slots[slot] = item
+            if item.requires_attunement:
+                equipment.attuned_items.append(item)
+        return equipment
     
     def equip_item(self, item_id, slot_name):
         """
@@ -107,15 +141,16 @@ class Character(db.Model):
             slot_name (str): Name of the equipment slot
             
         Returns:
-            tuple: (success, message) where success is a boolean and message is a string
+            tuple: (success, message) where success is a boolean and message is a string.
+            The change is left in the session for the caller to commit.
         """
-        item = Item.query.get(item_id)
-        if not item or item.character_id != self.id:
+        # The equipment manager loads the inventory anyway, so look the item up there
+        item = next((item for item in self.inventory if item.id == item_id), None)
+        if item is None:
             return False, "Item not found in inventory"
         
-        try:
-            slot = EquipmentSlot(slot_name)
-        except ValueError:
+        slot = _SLOT_BY_NAME.get(slot_name) if isinstance(slot_name, str) else None
+        if slot is None:
             return False, "Invalid equipment slot"
         
         # Use equipment manager to equip item
@@ -123,7 +158,6 @@ class Character(db.Model):
         if success:
             # Update database
             item.equipped_slot = slot.value
-            db.session.commit()
         
         return success, message
     
@@ -137,18 +171,17 @@ class Character(db.Model):
             slot_name (str): Name of the equipment slot
             
         Returns:
-            tuple: (success, message) where success is a boolean and message is a string
+            tuple: (success, message) where success is a boolean and message is a string.
+            The change is left in the session for the caller to commit.
         """
-        try:
-            slot = EquipmentSlot(slot_name)
-        except ValueError:
+        slot = _SLOT_BY_NAME.get(slot_name) if isinstance(slot_name, str) else None
+        if slot is None:
             return False, "Invalid equipment slot"
         
         item = self.equipment.unequip_item(slot)
         if item:
             # Update database
             item.equipped_slot = None
-            db.session.commit()
             return True, f"Unequipped {item.name}"
         
         return False, "No item equipped in that slot"
@@ -158,7 +191,7 @@ class Character(db.Model):
         Add an item to character inventory with enhanced properties.
         
         This method creates a new Item instance and adds it to the character's
-        inventory with all the specified properties.
+        inventory with all the specified properties. The caller commits.
         
         Args:
             name (str): Name of the item
@@ -185,6 +218,10 @@ class Character(db.Model):
         Returns:
             Item: The newly created and added item
         """
+        fields = {**_ITEM_DEFAULTS, **kwargs}
+        tags = fields.pop('tags', None)
+        effects = fields.pop('effects', None)
+        weapon_properties = fields.pop('weapon_properties', None)
         item = Item(
             name=name,
             item_type=item_type,
@@ -192,73 +229,82 @@ class Character(db.Model):
             weight=weight,
             value=value,
             character_id=self.id,
-            # Enhanced properties
-            rarity=kwargs.get('rarity', 'common'),
-            magical=kwargs.get('magical', False),
-            requires_attunement=kwargs.get('requires_attunement', False),
-            damage=kwargs.get('damage'),
-            damage_type=kwargs.get('damage_type'),
-            base_ac=kwargs.get('base_ac'),
-            armor_type=kwargs.get('armor_type'),
-            strength_req=kwargs.get('strength_req', 0),
-            stealth_disadvantage=kwargs.get('stealth_disadvantage', False),
-            enchantment_bonus=kwargs.get('enchantment_bonus', 0),
-            uses=kwargs.get('uses'),
-            max_uses=kwargs.get('max_uses'),
-            charges=kwargs.get('charges'),
-            max_charges=kwargs.get('max_charges')
+            **fields,
         )
         
-        # Handle complex properties
-        if 'tags' in kwargs:
-            item.set_tags_list(kwargs['tags'])
-        if 'effects' in kwargs:
-            item.set_effects_list(kwargs['effects'])
-        if 'weapon_properties' in kwargs:
-            import json
-            item.weapon_properties = json.dumps(kwargs['weapon_properties'])
+        # JSON list columns store NULL rather than an empty list
+        item.set_tags_list(tags)
+        item.set_effects_list(effects)
+        item.weapon_properties = list(weapon_properties) if weapon_properties else None
         
         db.session.add(item)
-        db.session.commit()
         return item
     
     def remove_item(self, item_id):
         item = Item.query.get(item_id)
         if item and item.character_id == self.id:
             db.session.delete(item)
-            db.session.commit()
             return True
         return False
     
     @property
     def total_weight(self):
-        return sum(item.weight for item in self.inventory)
+        """Sum inventory weight, in SQL unless the inventory is already loaded."""
+        if 'inventory' in self.__dict__:
+            return float(sum(item.weight or 0 for item in self.inventory))
+        return db.session.query(
+            db.func.coalesce(db.func.sum(Item.weight), 0.0)
+        ).filter(Item.character_id == self.id).scalar()
     
-    @property
+    @hybrid_property
     def strength_modifier(self):
         return (self.strength - 10) // 2
     
-    @property
+    @strength_modifier.expression
+    def strength_modifier(cls):
+        return _modifier_expression(cls.strength)
+    
+    @hybrid_property
     def dexterity_modifier(self):
         return (self.dexterity - 10) // 2
     
-    @property
+    @dexterity_modifier.expression
+    def dexterity_modifier(cls):
+        return _modifier_expression(cls.dexterity)
+    
+    @hybrid_property
     def constitution_modifier(self):
         return (self.constitution - 10) // 2
     
-    @property
+    @constitution_modifier.expression
+    def constitution_modifier(cls):
+        return _modifier_expression(cls.constitution)
+    
+    @hybrid_property
     def intelligence_modifier(self):
         return (self.intelligence - 10) // 2
     
-    @property
+    @intelligence_modifier.expression
+    def intelligence_modifier(cls):
+        return _modifier_expression(cls.intelligence)
+    
+    @hybrid_property
     def wisdom_modifier(self):
         return (self.wisdom - 10) // 2
     
-    @property
+    @wisdom_modifier.expression
+    def wisdom_modifier(cls):
+        return _modifier_expression(cls.wisdom)
+    
+    @hybrid_property
     def charisma_modifier(self):
         return (self.charisma - 10) // 2
     
-    @property
+    @charisma_modifier.expression
+    def charisma_modifier(cls):
+        return _modifier_expression(cls.charisma)
+    
+    @hybrid_property
     def carrying_capacity(self):
         return self.strength * 15  # Basic carrying capacity rules
     
@@ -324,27 +370,23 @@ class Character(db.Model):
     
     def get_known_spells_list(self):
         """Get list of known spells."""
-        import json
         try:
-            return json.loads(self.known_spells or '[]')
+            return loads(self.known_spells or '[]')
         except:
             return []
     
     def set_known_spells_list(self, spells):
         """Set list of known spells."""
-        import json
-        self.known_spells = json.dumps(spells)
+        self.known_spells = dumps(spells)
     
     def get_prepared_spells_list(self):
         """Get list of prepared spells."""
-        import json
         try:
-            return json.loads(self.prepared_spells or '[]')
+            return loads(self.prepared_spells or '[]')
         except:
             return []
     
     def set_prepared_spells_list(self, spells):
         """Set list of prepared spells."""
-        import json
-        self.prepared_spells = json.dumps(spells)
+        self.prepared_spells = dumps(spells)
 
@@ -1,6 +1,7 @@
 """SQLAlchemy models for combat encounters."""
 
 from dnd_world.database import db
+from dnd_world.utils.serialization import loads
 
 
 class Combat(db.Model):
@@ -17,7 +18,14 @@ class Combat(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
     
-    combatants = db.relationship('Combatant', backref='combat', lazy=True, cascade='all, delete-orphan')
+    # Loaded in turn order (initiative high to low, ties by insertion) so no per-access sort is needed
+    combatants = db.relationship(
+        'Combatant',
+        backref='combat',
+        lazy=True,
+        cascade='all, delete-orphan',
+        order_by=lambda: (Combatant.initiative.desc(), Combatant.id),
+    )
     
     def __repr__(self):
         return f'<Combat {self.name}>'
@@ -25,7 +33,7 @@ class Combat(db.Model):
     @property
     def turn_order(self):
         """Get combatants ordered by initiative (highest first)."""
-        return sorted(self.combatants, key=lambda c: c.initiative, reverse=True)
+        return self.combatants
     
     @property 
     def current_combatant(self):
@@ -36,21 +44,25 @@ class Combat(db.Model):
         return None
     
     def next_turn(self):
-        """Advance to the next combatant's turn."""
+        """Advance to the next combatant's turn; the caller commits."""
         turn_order = self.turn_order
         if turn_order:
             self.current_turn = (self.current_turn + 1) % len(turn_order)
             if self.current_turn == 0:
                 self.current_round += 1
-            db.session.commit()
 
 class Combatant(db.Model):
     """
     Database model for combatants in a specific combat encounter.
     
     Links characters to combat encounters and tracks combat-specific state
-    like initiative, conditions, and temporary HP.
+    like initiative, conditions, and temporary HP. Mutating methods leave their
+    changes in the session for the caller to commit.
     """
+    __table_args__ = (
+        db.Index('ix_combatant_combat_init', 'combat_id', db.desc('initiative')),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     combat_id = db.Column(db.Integer, db.ForeignKey('combat.id', ondelete='CASCADE'), nullable=False)
     character_id = db.Column(db.Integer, db.ForeignKey('character.id', ondelete='CASCADE'), nullable=False)
@@ -58,7 +70,7 @@ class Combatant(db.Model):
     initiative = db.Column(db.Integer, nullable=False)
     current_hp = db.Column(db.Integer, nullable=False)
     temp_hp = db.Column(db.Integer, default=0)
-    conditions = db.Column(db.Text)
+    conditions = db.Column(db.JSON(none_as_null=True))  # list of condition names
     
     death_save_successes = db.Column(db.Integer, default=0)
     death_save_failures = db.Column(db.Integer, default=0)
@@ -90,43 +102,35 @@ class Combatant(db.Model):
     @property
     def is_dead(self):
         """Check if combatant is dead (3 death save failures or massive damage)."""
-        return self.death_save_failures >= 3 or self.current_hp <= -self.character.max_hp
+        if self.death_save_failures >= 3:
+            return True
+        # Massive damage needs HP at or below zero, so conscious combatants skip the character load
+        return self.current_hp <= 0 and self.current_hp <= -self.character.max_hp
     
     @property
     def conditions_list(self):
         """Get list of active conditions."""
-        if self.conditions:
-            import json
-            try:
-                return json.loads(self.conditions)
-            except:
-                return []
-        return []
+        return list(self.conditions or [])
     
     def add_condition(self, condition):
         """Add a condition to the combatant."""
         conditions = self.conditions_list
         if condition not in conditions:
             conditions.append(condition)
-            import json
-            self.conditions = json.dumps(conditions)
-            db.session.commit()
+            self.conditions = conditions
     
     def remove_condition(self, condition):
         """Remove a condition from the combatant."""
         conditions = self.conditions_list
         if condition in conditions:
             conditions.remove(condition)
-            import json
-            self.conditions = json.dumps(conditions) if conditions else None
-            db.session.commit()
+            self.conditions = conditions or None
     
     def reset_turn_actions(self):
         """Reset actions for the start of a new turn."""
         self.has_action = True
         self.has_bonus_action = True
         self.has_movement = True
-        db.session.commit()
     
     def apply_damage(self, damage):
         """Apply damage to the combatant, handling temp HP."""
@@ -143,8 +147,6 @@ class Combatant(db.Model):
         if self.current_hp <= 0 and not self.is_dead:
             self.current_hp = 0
             self.add_condition('unconscious')
-        
-        db.session.commit()
     
     def heal(self, healing):
         """Apply healing to the combatant."""
@@ -155,8 +157,6 @@ class Combatant(db.Model):
             self.death_save_successes = 0
             self.death_save_failures = 0
             self.remove_condition('unconscious')
-        
-        db.session.commit()
 
 class CombatAction(db.Model):
     """
@@ -165,7 +165,7 @@ class CombatAction(db.Model):
     Records all actions for replay and analysis purposes.
     """
     id = db.Column(db.Integer, primary_key=True)
-    combat_id = db.Column(db.Integer, db.ForeignKey('combat.id', ondelete='CASCADE'), nullable=False)
+    combat_id = db.Column(db.Integer, db.ForeignKey('combat.id', ondelete='CASCADE'), nullable=False, index=True)
     actor_id = db.Column(db.Integer, db.ForeignKey('combatant.id', ondelete='CASCADE'), nullable=False)
     target_id = db.Column(db.Integer, db.ForeignKey('combatant.id', ondelete='SET NULL'), nullable=True)
     
@@ -250,7 +250,7 @@ class Enemy(db.Model):
         """Parse actions JSON string into list."""
         if self.actions:
             try:
-                return json.loads(self.actions)
+                return loads(self.actions)
             except:
                 return []
         return []
@@ -259,7 +259,7 @@ class Enemy(db.Model):
         """Parse special abilities JSON string into list."""
         if self.special_abilities:
             try:
-                return json.loads(self.special_abilities)
+                return loads(self.special_abilities)
             except:
                 return []
         return []
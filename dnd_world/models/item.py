@@ -11,6 +11,11 @@ class Item(db.Model):
     can possess. It contains both core properties shared by all items and specialized
     properties for different item types.
     """
+    __table_args__ = (
+        # Also serves lookups by character_id alone.
+        db.Index('ix_item_char_slot', 'character_id', 'equipped_slot'),
+    )
+
     # Core properties
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -24,14 +29,14 @@ class Item(db.Model):
     rarity = db.Column(db.String(20), default='common')  # common, uncommon, rare, very_rare, legendary, artifact
     magical = db.Column(db.Boolean, default=False)
     requires_attunement = db.Column(db.Boolean, default=False)
-    tags = db.Column(db.Text)  # JSON string for flexible categorization
-    effects = db.Column(db.Text)  # JSON string for item effects
+    tags = db.Column(db.JSON(none_as_null=True))  # list of tags for flexible categorization
+    effects = db.Column(db.JSON(none_as_null=True))  # list of item effect dicts
     equipped_slot = db.Column(db.String(50))  # Equipment slot if equipped
     
     # Weapon-specific properties
     damage = db.Column(db.String(20))
     damage_type = db.Column(db.String(20))
-    weapon_properties = db.Column(db.Text)  # JSON string
+    weapon_properties = db.Column(db.JSON(none_as_null=True))  # list of property strings
     enchantment_bonus = db.Column(db.Integer, default=0)
     
     # Armor-specific properties  
@@ -48,57 +53,45 @@ class Item(db.Model):
     charges = db.Column(db.Integer)
     max_charges = db.Column(db.Integer)
 
+    owner = db.relationship('Character', back_populates='inventory')
+
     def __repr__(self):
         """String representation of the item."""
         return f'<Item {self.name}>'
     
     def get_effects_list(self):
         """
-        Parse effects JSON string into list.
+        Get the item's effects.
         
         Returns:
             list: List of effect descriptions or empty list if none
         """
-        if self.effects:
-            import json
-            try:
-                return json.loads(self.effects)
-            except:
-                return []
-        return []
+        return self.effects or []
     
     def set_effects_list(self, effects_list):
         """
-        Store effects list as JSON string.
+        Store the item's effects.
         
         Args:
             effects_list (list): List of effect descriptions
         """
-        import json
-        self.effects = json.dumps(effects_list) if effects_list else None
+        self.effects = list(effects_list) if effects_list else None
     
     def get_tags_list(self):
         """
-        Parse tags JSON string into list.
+        Get the item's tags.
         
         Returns:
             list: List of tags or empty list if none
         """
-        if self.tags:
-            import json
-            try:
-                return json.loads(self.tags)
-            except:
-                return []
-        return []
+        return self.tags or []
     
     def set_tags_list(self, tags_list):
         """
-        Store tags list as JSON string.
+        Store the item's tags.
         
         Args:
             tags_list (list): List of tags
         """
-        import json
-        self.tags = json.dumps(tags_list) if tags_list else None
+        self.tags = list(tags_list) if tags_list else None
 
@@ -1,5 +1,5 @@
 """Utility helpers."""
 
-from . import dice
+from . import dice, serialization
 
-__all__ = ["dice"]
+__all__ = ["dice", "serialization"]
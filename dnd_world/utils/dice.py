@@ -91,7 +91,7 @@ class DiceRoller:
             raise ValueError("Too many dice (maximum 100)")
         
         # Roll the dice
-        rolls = [random.randint(1, die_size) for _ in range(num_dice)]
+        rolls = random.choices(range(1, die_size + 1), k=num_dice)
         total = sum(rolls) + modifier
         
         return DiceResult(
@@ -113,7 +113,7 @@ class DiceRoller:
             DiceResult: The result with the lowest die removed
         """
         # Roll 4d6
-        all_rolls = [random.randint(1, 6) for _ in range(4)]
+        all_rolls = random.choices(range(1, 7), k=4)
         
         # Drop the lowest
         all_rolls.sort()
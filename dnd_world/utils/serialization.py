@@ -0,0 +1,28 @@
+"""
+JSON helpers for the backend.
+
+Uses orjson when it is installed and falls back to the standard library
+``json`` module otherwise, so callers get the same ``dumps``/``loads`` API
+either way. ``dumps`` always returns ``str``.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def dumps(obj) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+else:
+    dumps = json.dumps
+    loads = json.loads
+
+
+__all__ = ["dumps", "loads"]